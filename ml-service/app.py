@@ -1,17 +1,23 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, send_from_directory
 from flask_cors import CORS
 import pickle
 import numpy as np
 import re
 from datetime import datetime
-from sklearn.metrics.pairwise import cosine_similarity
 from PIL import Image
 import io
 import base64
 import unicodedata
 import os
+import json
+import hmac
+import random
+import cProfile
+from collections import deque
 import requests
 import sys
+import time
+import zlib
 import numpy
 
 # --- TRUCO DE COMPATIBILIDAD PARA NUMPY 2.0 ---
@@ -63,16 +69,10 @@ except FileNotFoundError:
     print(f"ERROR: No se encontró el archivo en {MODEL_PATH}")
     raise
 
-# Cargar modelo de embeddings para busqueda semantica
-print("Cargando modelo de embeddings...")
-model_embed = None
-print("Modelo de embeddings cargado")
-
 # IA externa (Hugging Face)
 HF_TOKEN = os.environ.get("HF_TOKEN") 
 CLIP_API_URL = "https://api-inference.huggingface.co/models/openai/clip-vit-base-patch32"
 
-# Pre-calcular embeddings de estilos disponibles
 available_styles = list(style_encoder.classes_)
 
 print(f"Estilos disponibles: {available_styles}")
@@ -414,8 +414,109 @@ def normalize_results(results):
 
 import difflib
 
+# --- ÍNDICE VECTORIAL PARA BÚSQUEDA SEMÁNTICA DE ESTILOS ---
+# TF-IDF de n-gramas de caracteres con hashing: funciona offline, sin descargar modelos
+EMBED_DIM = 2 ** 14
+EMBED_NGRAM_RANGE = (3, 5)
+# Cada consulta ocupa una fila densa de EMBED_DIM floats (64 KB): se limita el tamaño del lote
+MAX_MATCH_BATCH = int(os.environ.get("MAX_MATCH_BATCH", "256"))
+
+def char_ngrams(text):
+    """Extrae los n-gramas de caracteres de cada palabra del texto"""
+    ngrams = []
+    for word in re.findall(r'\w+', normalize_text(text)):
+        padded = f' {word} '
+        for n in range(EMBED_NGRAM_RANGE[0], EMBED_NGRAM_RANGE[1] + 1):
+            ngrams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return ngrams
+
+def hash_vectorize(texts):
+    """Convierte textos en una matriz de frecuencias de n-gramas hasheados"""
+    counts = np.zeros((len(texts), EMBED_DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        buckets = [zlib.crc32(ngram.encode('utf-8')) % EMBED_DIM for ngram in char_ngrams(text)]
+        if buckets:
+            np.add.at(counts[row], buckets, 1.0)
+    return counts
+
+def tfidf_normalize(counts, idf):
+    """Aplica TF sublineal e IDF y normaliza cada fila a norma L2 unitaria"""
+    weighted = np.log1p(counts) * idf
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return weighted / np.maximum(norms, 1e-12)
+
+def build_style_index(styles):
+    """Pre-calcula la matriz normalizada de vectores de nombre, descripción y prompts de cada estilo"""
+    prompts_by_style = {normalize_text(k): v for k, v in STYLE_CLIP_PROMPTS.items()}
+    texts = []
+    offsets = []
+    for style in styles:
+        key = normalize_text(style)
+        offsets.append(len(texts))
+        texts.append(style)
+        if key in STYLE_DESCRIPTIONS:
+            texts.append(STYLE_DESCRIPTIONS[key])
+        texts.extend(prompts_by_style.get(key, []))
+
+    counts = hash_vectorize(texts)
+    doc_freq = (counts > 0).sum(axis=0)
+    idf = (np.log((1 + len(texts)) / (1 + doc_freq)) + 1).astype(np.float32)
+
+    return {
+        'matrix': tfidf_normalize(counts, idf),
+        'idf': idf,
+        'offsets': np.array(offsets),
+        'styles': list(styles)
+    }
+
+print("Construyendo índice vectorial de estilos...")
+style_index = build_style_index(available_styles)
+print(f"Índice semántico listo: {style_index['matrix'].shape[0]} vectores x {EMBED_DIM} dimensiones")
+
+def semantic_style_scores(queries):
+    """Puntúa un lote de consultas contra todos los estilos con un solo producto matricial"""
+    query_vectors = tfidf_normalize(hash_vectorize(queries), style_index['idf'])
+    row_scores = query_vectors @ style_index['matrix'].T
+    # Cada estilo se queda con la mejor coincidencia entre su nombre, descripción y prompts
+    return np.maximum.reduceat(row_scores, style_index['offsets'], axis=1)
+
+def find_similar_styles(input_styles):
+    """Búsqueda semántica de estilos en lote, devuelve una lista de (estilo, similitud)"""
+    exact_styles = {normalize_text(s): s for s in available_styles}
+    matches = [None] * len(input_styles)
+    pending = []
+
+    # 1. Búsqueda exacta
+    for i, input_style in enumerate(input_styles):
+        input_style_norm = normalize_text(input_style)
+        if input_style_norm in exact_styles:
+            matches[i] = (exact_styles[input_style_norm], 1.0)
+        else:
+            pending.append(i)
+
+    if not pending:
+        return matches
+
+    # 2. Búsqueda semántica sobre el índice pre-calculado
+    scores = semantic_style_scores([input_styles[i] or '' for i in pending])
+    best_idx = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(pending)), best_idx]
+
+    for i, idx, score in zip(pending, best_idx, best_scores):
+        if score > 0:
+            matches[i] = (style_index['styles'][idx], float(score))
+        else:
+            # 3. Fallback difflib si no hay ningún n-grama en común
+            matches[i] = find_similar_style_difflib(input_styles[i])
+
+    return matches
+
 def find_similar_style(input_style):
-    """Búsqueda de estilo mejorada con similitud de texto"""
+    """Búsqueda semántica del estilo más parecido"""
+    return find_similar_styles([input_style])[0]
+
+def find_similar_style_difflib(input_style):
+    """Búsqueda de estilo por similitud de caracteres (fallback sin solapamiento semántico)"""
     input_style_norm = normalize_text(input_style)
     
     # 1. Búsqueda exacta
@@ -450,6 +551,36 @@ def find_similar_style(input_style):
             
     return best_style, best_ratio
 
+# Estación de cada mes del año (índice 0 = enero)
+SEASON_BY_MONTH = np.array([
+    'Invierno', 'Invierno', 'Primavera', 'Primavera', 'Primavera', 'Verano',
+    'Verano', 'Verano', 'Otono', 'Otono', 'Otono', 'Invierno'
+])
+MAX_FORECAST_MONTHS = 36
+
+def forecast_months(horizon, start=None):
+    """Fechas (año-mes) y estaciones de los próximos meses, calculadas de forma vectorizada"""
+    start = start or datetime.now()
+    base = np.datetime64(start.strftime('%Y-%m'), 'M')
+    dates = base + np.arange(1, horizon + 1)
+    month_idx = dates.astype(np.int64) % 12
+    return dates.astype(str), SEASON_BY_MONTH[month_idx]
+
+def encode_label(encoder, value):
+    """Codifica un valor comparando con las clases normalizadas del encoder (ValueError si no existe)"""
+    classes_norm = [normalize_text(c) for c in encoder.classes_]
+    idx = classes_norm.index(normalize_text(value))
+    return encoder.transform([encoder.classes_[idx]])[0]
+
+def predict_results(style_encoded, gender_encoded, seasons_encoded):
+    """Predice en una sola llamada al modelo los resultados de varias estaciones"""
+    X = np.column_stack([
+        np.full(len(seasons_encoded), style_encoded),
+        np.full(len(seasons_encoded), gender_encoded),
+        seasons_encoded
+    ])
+    return [results_map[idx_to_combination[idx]] for idx in model.predict(X)]
+
 def parse_time_natural(time_text):
     """Parsea texto de tiempo natural a meses"""
     if not time_text:
@@ -511,15 +642,17 @@ def analyze_image_style(image_data):
         if ',' in image_data:
             image_data = image_data.split(',')[1]
         image_bytes = base64.b64decode(image_data)
+        mark_stage('decode')
 
         if not HF_TOKEN:
             print("ADVERTENCIA: HF_TOKEN no configurado. Usando modo simulación.")
-            return generate_mock_results(image_bytes)
+            results = generate_mock_results(image_bytes)
+            mark_stage('mock_results')
+            return results
 
         headers = {"Authorization": f"Bearer {HF_TOKEN}"}
         
         # Lógica de reintento para errores temporales (como 503 loading)
-        import time
         max_retries = 3
         
         for attempt in range(max_retries):
@@ -527,8 +660,11 @@ def analyze_image_style(image_data):
                 response = requests.post(CLIP_API_URL, headers=headers, data=image_bytes)
                 
                 if response.status_code == 200:
+                    mark_stage('hf_api')
                     output = response.json()
-                    return [{'style': item['label'], 'confidence': item['score']} for item in output[:5]]
+                    results = [{'style': item['label'], 'confidence': item['score']} for item in output[:5]]
+                    mark_stage('postprocess')
+                    return results
                 
                 if response.status_code == 503:
                     print(f"Intento {attempt+1}/{max_retries}: Modelo cargando (503)...")
@@ -542,15 +678,146 @@ def analyze_image_style(image_data):
                 time.sleep(1)
         
         # Si fallan todos los intentos reales, usar fallback si es posible
+        mark_stage('hf_api')
         print("ERROR CRÍTICO: Fallaron todos los intentos a la API de HF. Usando fallback simulación.")
         # Retornamos simulación pero podríamos marcarlo como tal en el futuro
-        return generate_mock_results(image_bytes)
+        results = generate_mock_results(image_bytes)
+        mark_stage('mock_results')
+        return results
 
     except Exception as e:
         print(f"Error general en analyze_image_style: {e}")
         # En caso de error fatal (ej. imagen corrupta), devolvemos None para que el endpoint devuelva error 500
         return None
 
+# --- PERFILADO DE PETICIONES Y REGISTRO DE PETICIONES LENTAS ---
+# Desactivado por defecto: solo se perfila con muestreo (PROFILE_SAMPLE_RATE) o con la
+# cabecera X-Profile igual a ADMIN_TOKEN. El coste sin perfilar son dos perf_counter por etapa.
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = os.environ.get("PROFILE_DIR", os.path.join(BASE_DIR, 'profiles'))
+PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", "20"))
+SLOW_REQUEST_MS = float(os.environ.get("SLOW_REQUEST_MS", "1000"))
+PROFILED_ENDPOINTS = {'predict', 'analyze_image', 'forecast'}
+
+# Generador propio: generate_mock_results re-siembra el global con el hash de la imagen
+profile_rng = random.Random()
+slow_requests = deque(maxlen=int(os.environ.get("SLOW_REQUEST_LOG_SIZE", "100")))
+
+def mark_stage(name):
+    """Registra el tiempo transcurrido desde la etapa anterior de la petición"""
+    if 'stages' not in g:
+        return
+    now = time.perf_counter()
+    g.stages[name] = (now - g.stage_clock) * 1000
+    g.stage_clock = now
+
+def describe_input(endpoint, data):
+    """Resume la forma de la entrada sin guardar su contenido"""
+    if not isinstance(data, dict):
+        return {'body_bytes': request.content_length or 0}
+    if endpoint == 'analyze_image':
+        return {'image_b64_chars': len(data.get('image') or '')}
+    return {key: len(str(value)) if value is not None else None for key, value in data.items()}
+
+def save_profile(profiler, endpoint, elapsed_ms):
+    """Guarda el perfil en disco y elimina los más antiguos (buffer circular)"""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}_{endpoint}_{elapsed_ms:.0f}ms.prof"
+    profiler.dump_stats(os.path.join(PROFILE_DIR, name))
+
+    profiles = sorted(f for f in os.listdir(PROFILE_DIR) if f.endswith('.prof'))
+    for old in profiles[:-PROFILE_MAX_FILES]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, old))
+        except OSError:
+            pass
+    return name
+
+def admin_token_matches(value, prefix=''):
+    """Compara en tiempo constante con el token de administración (desactivado si no hay ADMIN_TOKEN)"""
+    if not ADMIN_TOKEN or value is None:
+        return False
+    return hmac.compare_digest(value.encode('utf-8'), f'{prefix}{ADMIN_TOKEN}'.encode('utf-8'))
+
+def is_admin_request():
+    """Comprueba la cabecera Authorization de los endpoints de administración"""
+    return admin_token_matches(request.headers.get('Authorization'), prefix='Bearer ')
+
+@app.before_request
+def start_request_profiling():
+    if request.endpoint not in PROFILED_ENDPOINTS or request.method == 'OPTIONS':
+        return
+    g.request_start = g.stage_clock = time.perf_counter()
+    g.stages = {}
+
+    header_trigger = admin_token_matches(request.headers.get('X-Profile'))
+    if header_trigger or (PROFILE_SAMPLE_RATE > 0 and profile_rng.random() < PROFILE_SAMPLE_RATE):
+        g.profiler = cProfile.Profile()
+        try:
+            g.profiler.enable()
+        except ValueError:
+            # Ya hay otro perfilador activo en este proceso
+            g.pop('profiler')
+
+@app.after_request
+def finish_request_profiling(response):
+    if 'request_start' not in g:
+        return response
+    elapsed_ms = (time.perf_counter() - g.request_start) * 1000
+
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        try:
+            response.headers['X-Profile-Id'] = save_profile(profiler, request.endpoint, elapsed_ms)
+        except OSError as e:
+            print(f"Error guardando perfil: {e}")
+
+    if elapsed_ms > SLOW_REQUEST_MS:
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'total_ms': elapsed_ms,
+            'stages_ms': g.stages,
+            'input_shape': describe_input(request.endpoint, request.get_json(silent=True))
+        }
+        slow_requests.append(entry)
+        print(f"[PETICION LENTA] {json.dumps(entry)}")
+
+    return response
+
+@app.route('/admin/profiles', methods=['GET'])
+def list_profiles():
+    if not is_admin_request():
+        return jsonify({'error': 'No autorizado'}), 401
+
+    profiles = []
+    if os.path.isdir(PROFILE_DIR):
+        for name in sorted(os.listdir(PROFILE_DIR), reverse=True):
+            if name.endswith('.prof'):
+                profiles.append({
+                    'id': name,
+                    'size_bytes': os.path.getsize(os.path.join(PROFILE_DIR, name))
+                })
+    return jsonify({'profiles': profiles})
+
+@app.route('/admin/profiles/<profile_id>', methods=['GET'])
+def download_profile(profile_id):
+    if not is_admin_request():
+        return jsonify({'error': 'No autorizado'}), 401
+    if not profile_id.endswith('.prof'):
+        return jsonify({'error': 'Perfil no encontrado'}), 404
+    # send_from_directory rechaza rutas fuera de PROFILE_DIR
+    return send_from_directory(PROFILE_DIR, profile_id, as_attachment=True)
+
+@app.route('/admin/slow-requests', methods=['GET'])
+def list_slow_requests():
+    if not is_admin_request():
+        return jsonify({'error': 'No autorizado'}), 401
+    return jsonify({'threshold_ms': SLOW_REQUEST_MS, 'slow_requests': list(slow_requests)})
+
 @app.route('/health', methods=['GET', 'OPTIONS'])
 def health():
     if request.method == 'OPTIONS':
@@ -564,6 +831,10 @@ def health():
             'nlp_time_parsing': True,
             'image_analysis': True
         },
+        'semantic_index': {
+            'vectors': int(style_index['matrix'].shape[0]),
+            'dimensions': EMBED_DIM
+        },
         'available_styles': available_styles,
         'available_genders': list(gender_encoder.classes_),
         'available_seasons': list(season_encoder.classes_)
@@ -600,6 +871,44 @@ def analyze_image():
         print(f"Error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/match-styles', methods=['POST', 'OPTIONS'])
+def match_styles():
+    if request.method == 'OPTIONS':
+        return '', 204
+    
+    try:
+        data = request.json
+        styles_input = data.get('styles')
+        
+        if not isinstance(styles_input, list) or not styles_input:
+            return jsonify({'error': 'Se requiere una lista de estilos en "styles"'}), 400
+        
+        if len(styles_input) > MAX_MATCH_BATCH:
+            return jsonify({'error': f'Máximo {MAX_MATCH_BATCH} estilos por petición'}), 400
+        
+        if not all(isinstance(style, str) for style in styles_input):
+            return jsonify({'error': 'Todos los estilos deben ser texto'}), 400
+        
+        batch_start = time.perf_counter()
+        matches = find_similar_styles(styles_input)
+        batch_ms = (time.perf_counter() - batch_start) * 1000
+        
+        print(f"\n[BUSQUEDA EN LOTE] {len(styles_input)} estilos en {batch_ms:.2f} ms")
+        
+        return jsonify({
+            'success': True,
+            'matches': [
+                {'original_input': original, 'matched_style': style, 'style_similarity': similarity}
+                for original, (style, similarity) in zip(styles_input, matches)
+            ],
+            'batch_ms': batch_ms,
+            'per_query_ms': batch_ms / len(styles_input)
+        })
+        
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/predict', methods=['POST', 'OPTIONS'])
 def predict():
     if request.method == 'OPTIONS':
@@ -614,8 +923,11 @@ def predict():
         
         print(f"\n[PREDICCION] Entrada: {style_input} | {gender} | {season} | {time_input}")
         
+        match_start = time.perf_counter()
         matched_style, similarity = find_similar_style(style_input)
-        print(f"Estilo encontrado: '{matched_style}' (similitud: {similarity:.2%})")
+        match_ms = (time.perf_counter() - match_start) * 1000
+        print(f"Estilo encontrado: '{matched_style}' (similitud: {similarity:.2%}, {match_ms:.2f} ms)")
+        mark_stage('match_style')
         
         if similarity < 0.5:
             print(f"Baja similitud, usando estilo mas cercano")
@@ -624,56 +936,35 @@ def predict():
         if time_input:
             months = parse_time_natural(time_input)
             print(f"Tiempo parseado: '{time_input}' -> {months} meses")
-        
-        gender_norm = normalize_text(gender)
-        gender_classes_norm = [normalize_text(g) for g in gender_encoder.classes_]
+        mark_stage('parse_time')
         
         try:
-            gender_idx = gender_classes_norm.index(gender_norm)
-            gender_encoded = gender_encoder.transform([gender_encoder.classes_[gender_idx]])[0]
+            gender_encoded = encode_label(gender_encoder, gender)
         except ValueError:
             return jsonify({'error': f'Genero "{gender}" no encontrado'}), 404
         
         if not season:
-            future_month = (datetime.now().month + months - 1) % 12
-            season_map = {
-                (2, 3, 4): 'Primavera',
-                (5, 6, 7): 'Verano',
-                (8, 9, 10): 'Otono',
-                (11, 0, 1): 'Invierno'
-            }
-            for months_tuple, s in season_map.items():
-                if future_month in months_tuple:
-                    season = s
-                    break
-        
-        season_norm = normalize_text(season)
-        season_classes_norm = [normalize_text(s) for s in season_encoder.classes_]
+            season = SEASON_BY_MONTH[(datetime.now().month + months - 1) % 12]
         
         try:
-            season_idx = season_classes_norm.index(season_norm)
-            season_encoded = season_encoder.transform([season_encoder.classes_[season_idx]])[0]
+            season_encoded = encode_label(season_encoder, season)
         except ValueError:
             return jsonify({'error': f'Estacion "{season}" no encontrada'}), 404
         
         # Codificar el estilo encontrado
         style_encoded = style_encoder.transform([matched_style])[0]
+        mark_stage('encode')
         
-        # Crear input para el modelo
-        X = np.array([[style_encoded, gender_encoded, season_encoded]])
-        
-        # Predecir
-        prediction_idx = model.predict(X)[0]
-        combination = idx_to_combination[prediction_idx]
-        
-        # Obtener resultados del mapa
-        results = results_map[combination]
+        # Predecir y obtener resultados del mapa
+        results = predict_results(style_encoded, gender_encoded, [season_encoded])[0]
+        mark_stage('model_predict')
         
         # Normalizar resultados con descripciones específicas
         normalized_results = normalize_results(results)
         
         # Obtener descripción del estilo
         style_description = get_style_description(matched_style)
+        mark_stage('normalize')
         
         print(f"Prediccion exitosa: {len(normalized_results['prendas'])} prendas encontradas")
         
@@ -681,6 +972,7 @@ def predict():
             'success': True,
             'matched_style': matched_style,
             'style_similarity': float(similarity),
+            'style_match_ms': match_ms,
             'style_description': style_description,
             'original_input': style_input,
             'prendas': normalized_results['prendas'],
@@ -696,10 +988,81 @@ def predict():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/forecast', methods=['POST', 'OPTIONS'])
+def forecast():
+    if request.method == 'OPTIONS':
+        return '', 204
+    
+    try:
+        data = request.json
+        style_input = data.get('style')
+        gender = data.get('gender')
+        time_input = data.get('time')
+        
+        print(f"\n[PREVISION] Entrada: {style_input} | {gender} | {time_input}")
+        
+        # Estilo y género se resuelven una sola vez para todo el horizonte
+        matched_style, similarity = find_similar_style(style_input)
+        print(f"Estilo encontrado: '{matched_style}' (similitud: {similarity:.2%})")
+        mark_stage('match_style')
+        
+        horizon = parse_time_natural(time_input) if time_input else 12
+        horizon = min(max(horizon, 1), MAX_FORECAST_MONTHS)
+        
+        try:
+            gender_encoded = encode_label(gender_encoder, gender)
+        except ValueError:
+            return jsonify({'error': f'Genero "{gender}" no encontrado'}), 404
+        
+        dates, month_seasons = forecast_months(horizon)
+        
+        # Cada estación distinta se predice una única vez
+        seasons, season_of_month = np.unique(month_seasons, return_inverse=True)
+        seasons_encoded = []
+        for season in seasons:
+            try:
+                seasons_encoded.append(encode_label(season_encoder, season))
+            except ValueError:
+                return jsonify({'error': f'Estacion "{season}" no encontrada'}), 404
+        season_names = [str(season_encoder.classes_[idx]) for idx in seasons_encoded]
+        mark_stage('encode')
+        
+        season_results = predict_results(style_encoder.transform([matched_style])[0], gender_encoded, seasons_encoded)
+        mark_stage('model_predict')
+        
+        results = {name: normalize_results(r) for name, r in zip(season_names, season_results)}
+        timeline = [
+            {'month': i + 1, 'date': date, 'season': season_names[idx]}
+            for i, (date, idx) in enumerate(zip(dates, season_of_month))
+        ]
+        mark_stage('normalize')
+        
+        print(f"Prevision exitosa: {horizon} meses, {len(results)} estaciones distintas")
+        
+        return jsonify({
+            'success': True,
+            'matched_style': matched_style,
+            'style_similarity': float(similarity),
+            'style_description': get_style_description(matched_style),
+            'original_input': style_input,
+            'horizon_months': horizon,
+            'timeline': timeline,
+            'results': results
+        })
+        
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
 if __name__ == '__main__':
     print("\nAPI de prediccion con IA iniciada")
     print("   - Health check: /health")
     print("   - Prediccion: POST /predict")
+    print("   - Prevision multi-mes: POST /forecast")
+    print("   - Busqueda de estilos en lote: POST /match-styles")
+    print("   - Perfiles y peticiones lentas: GET /admin/profiles, /admin/slow-requests")
     print("   - Analisis de imagen: POST /analyze-image")
     print("\n")
     port = int(os.environ.get('PORT', 5000))
@@ -0,0 +1,78 @@
+"""Benchmark de latencia de la API de moda.
+
+Uso: python benchmark.py [repeticiones]
+"""
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+import time
+
+import app as fashion_app
+from app import find_similar_style, find_similar_styles
+
+QUERIES = [
+    'preppy', 'techwear negra', 'streetwear', 'bohemio', 'gorpcore',
+    'minimalista', 'grunge', 'old money', 'lujo silencioso', 'coquette',
+    'dark academia', 'cayetano', 'ropa deportiva outdoor', 'estilo escandinavo',
+    'vestido largo hippie', 'lazos rosa'
+]
+
+def bench(label, fn, repeats, items=1):
+    """Ejecuta fn varias veces e imprime la latencia media"""
+    fn()  # calentamiento
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    total_ms = (time.perf_counter() - start) * 1000
+    per_call = total_ms / repeats
+    print(f"{label:<40} {per_call:8.3f} ms/llamada  {per_call / items:8.3f} ms/consulta")
+
+def bench_style_matching(repeats):
+    print(f"\n[BUSQUEDA DE ESTILOS] {len(QUERIES)} consultas, {repeats} repeticiones")
+    bench('Consulta individual', lambda: find_similar_style(QUERIES[0]), repeats)
+    bench('Consultas individuales en bucle', lambda: [find_similar_style(q) for q in QUERIES], repeats, len(QUERIES))
+    bench('Lote (un producto matricial)', lambda: find_similar_styles(QUERIES), repeats, len(QUERIES))
+
+    print("\nCoincidencias:")
+    for query, (style, similarity) in zip(QUERIES, find_similar_styles(QUERIES)):
+        print(f"  - {query!r} -> {style} ({similarity:.2%})")
+
+def bench_profiling_overhead(repeats):
+    print(f"\n[PERFILADO] POST /predict, {repeats} repeticiones")
+    client = fashion_app.app.test_client()
+    payload = {'style': 'techwear negra', 'gender': str(fashion_app.gender_encoder.classes_[0]), 'time': '3 meses'}
+    devnull = open(os.devnull, 'w')
+
+    def predict():
+        # Silenciar los print del endpoint para no medir la consola
+        with redirect_stdout(devnull):
+            client.post('/predict', json=payload)
+
+    hooks = (fashion_app.start_request_profiling, fashion_app.finish_request_profiling)
+    before = fashion_app.app.before_request_funcs[None]
+    after = fashion_app.app.after_request_funcs[None]
+
+    # Sin hooks de perfilado como referencia
+    before.remove(hooks[0])
+    after.remove(hooks[1])
+    try:
+        bench('Sin hooks', predict, repeats)
+    finally:
+        before.append(hooks[0])
+        after.append(hooks[1])
+
+    fashion_app.PROFILE_SAMPLE_RATE = 0
+    bench('Hooks instalados, perfilado desactivado', predict, repeats)
+
+    with tempfile.TemporaryDirectory() as profile_dir:
+        fashion_app.PROFILE_DIR = profile_dir
+        fashion_app.PROFILE_SAMPLE_RATE = 1.0
+        bench('Perfilado activado (cProfile)', predict, repeats)
+        fashion_app.PROFILE_SAMPLE_RATE = 0
+    devnull.close()
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    bench_style_matching(repeats)
+    bench_profiling_overhead(repeats)